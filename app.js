@@ -1,12 +1,20 @@
+// Uploads at least this large are sent to the local Python engine when it is running.
+const ENGINE_AUTO_THRESHOLD = 5000;
+const ENGINE_ENDPOINT = '/api/allocate';
+// Strategies the in-browser allocator does not implement.
+const ENGINE_ONLY_ALGORITHMS = new Set(['grouped']);
+
 class ExamRoomOrchestrator {
     constructor() {
         this.currentStep = 1;
+        this.allocationPending = false;
         this.state = {
             enrollmentRows: [],
             rooms: [],
             selectedAlgorithm: 'smart',
             maxCoursesPerRoom: 3,
             slotCapacityMode: 'greedy',
+            engineMode: 'auto',
             selectedSemesters: new Set(),
             selectedCourses: new Set(),
             availableSemesters: [],
@@ -51,6 +59,7 @@ class ExamRoomOrchestrator {
             maxCoursesInput: document.getElementById('max-courses'),
             slotCapacityMode: document.getElementById('slot-capacity-mode'),
             seedInput: document.getElementById('seed'),
+            engineModeSelect: document.getElementById('engine-mode'),
 
             // Filters (step 3)
             filtersContainer: document.getElementById('filters-container'),
@@ -163,7 +172,7 @@ class ExamRoomOrchestrator {
     }
 
     bindAlgorithmControls() {
-        const { algorithmRadios, maxCoursesInput, slotCapacityMode } = this.elements;
+        const { algorithmRadios, maxCoursesInput, slotCapacityMode, engineModeSelect } = this.elements;
         if (algorithmRadios.length) {
             algorithmRadios.forEach(radio => {
                 radio.addEventListener('change', (event) => {
@@ -188,6 +197,11 @@ class ExamRoomOrchestrator {
                 this.state.slotCapacityMode = event.target.value || 'greedy';
             });
         }
+        if (engineModeSelect) {
+            engineModeSelect.addEventListener('change', (event) => {
+                this.state.engineMode = event.target.value || 'auto';
+            });
+        }
     }
 
     bindFilterControls() {
@@ -855,6 +869,9 @@ class ExamRoomOrchestrator {
     }
 
     handleNextStep(stepIncrement = 1) {
+        if (this.allocationPending) {
+            return;
+        }
         if (this.currentStep === 4) {
             this.resetToStepOne();
             return;
@@ -869,10 +886,16 @@ class ExamRoomOrchestrator {
                 return;
             }
             if (targetStep === 4) {
-                const prepared = this.prepareAssignments();
-                if (!prepared) {
-                    return;
-                }
+                // Allocation may run on the Python engine, so finish the step once it resolves.
+                this.setAllocationPending(true);
+                this.prepareAssignments()
+                    .then(prepared => {
+                        if (prepared) {
+                            this.goToStep(targetStep);
+                        }
+                    })
+                    .finally(() => this.setAllocationPending(false));
+                return;
             }
             this.goToStep(targetStep);
             stepsRemaining -= 1;
@@ -882,6 +905,13 @@ class ExamRoomOrchestrator {
         }
     }
 
+    setAllocationPending(pending) {
+        this.allocationPending = pending;
+        if (this.elements.nextBtn) {
+            this.elements.nextBtn.disabled = pending;
+        }
+    }
+
     goToStep(step) {
         if (step < 1 || step > 4) {
             return;
@@ -942,7 +972,7 @@ class ExamRoomOrchestrator {
         return true;
     }
 
-    prepareAssignments() {
+    async prepareAssignments() {
         if (!this.state.enrollmentRows.length || !this.state.rooms.length) {
             this.notify('Upload both enrollment and room data before generating assignments.', 'error');
             return false;
@@ -957,7 +987,7 @@ class ExamRoomOrchestrator {
             this.notify('Unable to derive exam slots. Please double check the schedule configuration.', 'error');
             return false;
         }
-        const assignments = this.generateAssignments(filteredStudents, slotInstances);
+        const assignments = await this.runAllocation(filteredStudents, slotInstances);
         if (!assignments.length) {
             this.notify('Unable to allocate students to rooms with the current configuration. Consider increasing max courses per room or adjusting filters.', 'error');
             return false;
@@ -1078,6 +1108,101 @@ class ExamRoomOrchestrator {
         return assignments;
     }
 
+    shouldUseEngine(students) {
+        if (this.state.engineMode === 'python' || ENGINE_ONLY_ALGORITHMS.has(this.state.selectedAlgorithm)) {
+            return true;
+        }
+        return this.state.engineMode === 'auto' && students.length >= ENGINE_AUTO_THRESHOLD;
+    }
+
+    async runAllocation(students, slotInstances) {
+        if (this.shouldUseEngine(students)) {
+            try {
+                return await this.requestEngineAssignments(students, slotInstances);
+            } catch (error) {
+                if (ENGINE_ONLY_ALGORITHMS.has(this.state.selectedAlgorithm)) {
+                    this.notify(`"Keep Courses Together" runs on the Python engine, which failed (${error.message}). Start it with "python scheduler_server.py".`, 'error');
+                    return [];
+                }
+                if (this.state.engineMode === 'python') {
+                    this.notify(`Python engine request failed (${error.message}). Start it with "python scheduler_server.py".`, 'error');
+                    return [];
+                }
+                this.notify(`Python engine unavailable (${error.message}); using the in-browser allocator.`, 'info');
+            }
+        }
+        return this.generateAssignments(students, slotInstances);
+    }
+
+    encodeEnrollments(students) {
+        // Send each course, semester and student once; enrollments become index triples.
+        const courseIndex = new Map();
+        const semesterIndex = new Map();
+        const studentIndex = new Map();
+        const courses = [];
+        const semesters = [];
+        const people = [];
+        const enrollments = new Array(students.length * 3);
+        students.forEach((row, position) => {
+            const code = row['Subject Code'] || 'UNKNOWN';
+            const name = row['Subject Name'] || code;
+            const courseKey = `${code}\u0000${name}`;
+            if (!courseIndex.has(courseKey)) {
+                courseIndex.set(courseKey, courses.length);
+                courses.push([code, name]);
+            }
+            const semester = row['Student Session'] || 'UNKNOWN';
+            if (!semesterIndex.has(semester)) {
+                semesterIndex.set(semester, semesters.length);
+                semesters.push(semester);
+            }
+            const roll = row['Student Roll Number'] || `ROW-${position + 1}`;
+            if (!studentIndex.has(roll)) {
+                studentIndex.set(roll, people.length);
+                people.push([roll, row['Student Name'] || '']);
+            }
+            enrollments[position * 3] = courseIndex.get(courseKey);
+            enrollments[position * 3 + 1] = semesterIndex.get(semester);
+            enrollments[position * 3 + 2] = studentIndex.get(roll);
+        });
+        return { courses, semesters, students: people, enrollments };
+    }
+
+    async requestEngineAssignments(students, slotInstances) {
+        const rooms = this.state.rooms;
+        const payload = {
+            ...this.encodeEnrollments(students),
+            rooms: rooms.map(room => ({ id: room.id, name: room.name, capacity: room.capacity, building: room.building })),
+            slots: slotInstances.map(slot => ({ id: slot.id, date: slot.date, label: slot.label, start: slot.start, end: slot.end })),
+            algorithm: this.state.selectedAlgorithm,
+            maxCoursesPerRoom: this.state.maxCoursesPerRoom,
+            seed: this.elements.seedInput?.value.trim() || ''
+        };
+        const response = await fetch(ENGINE_ENDPOINT, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload)
+        });
+        const result = await response.json().catch(() => ({}));
+        if (!response.ok) {
+            throw new Error(result.error || `HTTP ${response.status}`);
+        }
+        const assignments = [];
+        result.slots.forEach((slotPlan, slotIndex) => {
+            const slot = slotInstances[slotIndex];
+            slotPlan.room_indices.forEach((roomIndex, position) => {
+                const start = slotPlan.offsets[position];
+                const end = slotPlan.offsets[position + 1];
+                assignments.push({
+                    slot,
+                    room: rooms[roomIndex],
+                    students: slotPlan.row_ids.slice(start, end).map(row => students[row])
+                });
+            });
+        });
+        return assignments;
+    }
+
     groupStudentsByCourse(students) {
         const buckets = {};
         students.forEach(student => {
@@ -0,0 +1,73 @@
+// Node harness used by bench_parity.py: runs the browser allocator from app.js
+// outside the browser on a JSON input read from stdin.
+//
+// Input:  { app, rooms, students, slots, maxCoursesPerRoom, seed, repeat }
+// Output: { elapsed_ms: [..], assignments: [[slotIndex, roomIndex, [rowIndex, ...]], ...] }
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+function mulberry32(seed) {
+    let state = seed >>> 0;
+    return function random() {
+        state = (state + 0x6D2B79F5) >>> 0;
+        let t = state;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+
+function loadOrchestrator(appPath) {
+    const source = fs.readFileSync(appPath, 'utf8');
+    const match = source.match(/^class\s+(\w+)/m);
+    if (!match) {
+        throw new Error(`No top-level class found in ${appPath}`);
+    }
+    const context = vm.createContext({
+        console,
+        document: { addEventListener() {} },
+        window: {}
+    });
+    vm.runInContext(`${source}\n;globalThis.__Orchestrator = ${match[1]};`, context, { filename: appPath });
+    return context;
+}
+
+function main() {
+    const input = JSON.parse(fs.readFileSync(0, 'utf8'));
+    const context = loadOrchestrator(path.resolve(input.app));
+    const Orchestrator = context.__Orchestrator;
+    const contextMath = vm.runInContext('Math', context);
+    if (typeof Orchestrator.prototype.generateAssignments !== 'function') {
+        throw new Error('The app class has no generateAssignments method.');
+    }
+
+    const rooms = input.rooms.map((room, index) => ({ ...room, __index: index }));
+    const slots = input.slots.map((slot, index) => ({ ...slot, __index: index }));
+    const repeat = Math.max(1, input.repeat || 1);
+    const elapsed = [];
+    let assignments = [];
+    for (let run = 0; run < repeat; run += 1) {
+        // Same seed for every repeat so timings cover identical work.
+        contextMath.random = mulberry32(input.seed || 0);
+        const students = input.students.map((record, index) => ({ ...record, __row: index }));
+        const app = Object.create(Orchestrator.prototype);
+        app.state = { rooms, maxCoursesPerRoom: input.maxCoursesPerRoom };
+        const started = process.hrtime.bigint();
+        assignments = app.generateAssignments(students, slots);
+        elapsed.push(Number(process.hrtime.bigint() - started) / 1e6);
+    }
+
+    process.stdout.write(JSON.stringify({
+        elapsed_ms: elapsed,
+        assignments: assignments.map(assignment => [
+            assignment.slot.__index,
+            assignment.room.__index,
+            assignment.students.map(student => student.__row)
+        ])
+    }));
+}
+
+main();
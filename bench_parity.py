@@ -0,0 +1,378 @@
+"""Cross-implementation benchmark and parity suite.
+
+Runs the Python scheduler (exam_scheduler.schedule_exams) and the browser
+allocator (``generateAssignments`` in app.js, executed under Node with a seeded
+``Math.random``) on the same seeded inputs, then reports speed, schedule
+metrics and differences between the two. Both engines must respect room
+capacity, the courses-per-room limit and seat every enrollment at most once;
+any violation makes the script exit non-zero.
+
+    python bench_parity.py                              # synthetic, 20k enrollments
+    python bench_parity.py --enrollments 200000 --rooms 300
+    python bench_parity.py --students-csv processed_enrollment.csv --rooms-csv room.csv
+    python bench_parity.py --json parity_report.json
+"""
+
+import argparse
+import json
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from exam_scheduler import (
+    Room,
+    RoomAssignment,
+    Student,
+    compute_schedule_metrics,
+    load_rooms_from_csv,
+    load_students_from_csv,
+    schedule_exams,
+    seeded_rng,
+)
+
+REPO_DIR = Path(__file__).resolve().parent
+JS_HARNESS = REPO_DIR / "bench_parity.js"
+ROOM_SIZES = (30, 35, 41, 45, 59, 60, 80, 120)
+
+
+def generate_inputs(
+    enrollments: int, courses: int, room_count: int, buildings: int, seed: int
+) -> Tuple[List[Room], List[Student]]:
+    rng = random.Random(seed)
+    rooms = [
+        Room(
+            room_id=f"B{index % buildings + 1}-{index + 101}",
+            room_name=str(index + 101),
+            capacity=rng.choice(ROOM_SIZES),
+            building=f"B{index % buildings + 1}",
+        )
+        for index in range(room_count)
+    ]
+    rooms.sort(key=lambda room: room.capacity, reverse=True)
+
+    # Skewed course sizes: a few large first-year courses, many small electives.
+    weights = [1.0 / (rank + 1) ** 0.8 for rank in range(courses)]
+    course_semesters = [f"SEMESTER {2 * rng.randint(1, 4)}" for _ in range(courses)]
+    students: List[Student] = []
+    student_count = max(1, enrollments // 5)
+    for row in range(enrollments):
+        student_id = rng.randrange(student_count)
+        course = rng.choices(range(courses), weights=weights)[0]
+        students.append(
+            Student(
+                roll_number=f"2024S{student_id:06d}",
+                name=f"Student {student_id}",
+                subject_code=f"C{course:04d}",
+                subject_name=f"Course {course}",
+                semester=course_semesters[course],
+            )
+        )
+    return rooms, students
+
+
+def build_schedule(days: int, slots_per_day: int) -> List[Dict[str, str]]:
+    return [
+        {
+            "date": f"2025-05-{18 + day:02d}",
+            "slot_name": f"Slot {slot + 1}",
+            "slot_time": "09:00 - 12:00" if slot == 0 else "14:00 - 17:00",
+        }
+        for day in range(days)
+        for slot in range(slots_per_day)
+    ]
+
+
+def run_python(
+    rooms: Sequence[Room],
+    students: Sequence[Student],
+    exam_schedule: List[Dict[str, str]],
+    algorithm: str,
+    max_courses: int,
+    seed: int,
+    repeat: int,
+) -> Tuple[List[float], Dict[int, List[RoomAssignment]], int]:
+    timings: List[float] = []
+    slot_assignments: Dict[int, List[RoomAssignment]] = {}
+    unplaced = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        slot_assignments, spillover = schedule_exams(
+            rooms=rooms,
+            students=students,
+            exam_schedule=exam_schedule,
+            algorithm_type=algorithm,
+            max_courses_per_room=max_courses,
+            rng=seeded_rng(str(seed)),
+            verbose=False,
+        )
+        timings.append((time.perf_counter() - started) * 1000)
+        unplaced = sum(len(group) for group in spillover.values())
+    return timings, slot_assignments, unplaced
+
+
+def run_browser(
+    app_path: Path,
+    rooms: Sequence[Room],
+    students: Sequence[Student],
+    exam_schedule: List[Dict[str, str]],
+    max_courses: int,
+    seed: int,
+    repeat: int,
+) -> Tuple[List[float], Dict[int, List[RoomAssignment]], int]:
+    node = shutil.which("node")
+    if node is None:
+        raise RuntimeError("Node.js is required to run the browser allocator.")
+    payload = {
+        "app": str(app_path),
+        "rooms": [
+            {
+                "id": room.room_id,
+                "name": room.room_name,
+                "capacity": room.capacity,
+                "building": room.building or "",
+            }
+            for room in rooms
+        ],
+        "students": [
+            {
+                "Student Session": student.semester,
+                "Student Roll Number": student.roll_number,
+                "Student Name": student.name,
+                "Subject Code": student.subject_code,
+                "Subject Name": student.subject_name,
+            }
+            for student in students
+        ],
+        "slots": [
+            {"id": f"slot-{index + 1}", "date": slot["date"], "label": slot["slot_name"]}
+            for index, slot in enumerate(exam_schedule)
+        ],
+        "maxCoursesPerRoom": max_courses,
+        "seed": seed,
+        "repeat": repeat,
+    }
+    completed = subprocess.run(
+        [node, str(JS_HARNESS)],
+        input=json.dumps(payload),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Browser allocator failed:\n{completed.stderr.strip()}")
+    result = json.loads(completed.stdout)
+
+    slot_assignments: Dict[int, List[RoomAssignment]] = {
+        index: [] for index in range(len(exam_schedule))
+    }
+    seated = 0
+    for slot_index, room_index, rows in result["assignments"]:
+        slot_assignments[slot_index].append(
+            RoomAssignment(room=rooms[room_index], students=[students[row] for row in rows])
+        )
+        seated += len(rows)
+    return result["elapsed_ms"], slot_assignments, len(students) - seated
+
+
+def check_invariants(
+    slot_assignments: Dict[int, List[RoomAssignment]], max_courses: int
+) -> List[str]:
+    problems: List[str] = []
+    seen: Counter = Counter()
+    for slot_index, assignments in slot_assignments.items():
+        used_rooms: Counter = Counter()
+        for assignment in assignments:
+            room = assignment.room
+            used_rooms[room.room_id] += 1
+            aggregates = assignment.aggregates
+            if aggregates.assigned > room.capacity:
+                problems.append(
+                    f"slot {slot_index + 1}: room {room.room_id} seats "
+                    f"{aggregates.assigned} > capacity {room.capacity}"
+                )
+            if len(aggregates.course_counts) > max_courses:
+                problems.append(
+                    f"slot {slot_index + 1}: room {room.room_id} mixes "
+                    f"{len(aggregates.course_counts)} courses > {max_courses}"
+                )
+            seen.update(map(id, assignment.students))
+        problems.extend(
+            f"slot {slot_index + 1}: room {room_id} used {count} times"
+            for room_id, count in used_rooms.items()
+            if count > 1
+        )
+    duplicates = sum(1 for count in seen.values() if count > 1)
+    if duplicates:
+        problems.append(f"{duplicates} enrollment(s) seated more than once")
+    return problems
+
+
+def courses_split_across_slots(slot_assignments: Dict[int, List[RoomAssignment]]) -> int:
+    slots_per_course: Dict[Tuple[str, str], set] = {}
+    for slot_index, assignments in slot_assignments.items():
+        for assignment in assignments:
+            for course in assignment.aggregates.course_counts:
+                slots_per_course.setdefault(course, set()).add(slot_index)
+    return sum(1 for slots in slots_per_course.values() if len(slots) > 1)
+
+
+def summarize_engine(
+    name: str,
+    timings: List[float],
+    slot_assignments: Dict[int, List[RoomAssignment]],
+    unplaced: int,
+    exam_schedule: List[Dict[str, str]],
+    max_courses: int,
+) -> Dict[str, object]:
+    scorecard = compute_schedule_metrics(
+        exam_schedule, slot_assignments, unplaced_students=unplaced, run={"engine": name}
+    )
+    return {
+        "engine": name,
+        "median_ms": round(statistics.median(timings), 2),
+        "min_ms": round(min(timings), 2),
+        "seated": scorecard["totals"]["students_seated"],
+        "unplaced": unplaced,
+        "rooms_opened": scorecard["totals"]["rooms_opened"],
+        "seats_wasted": scorecard["totals"]["seats_wasted"],
+        "slot_conflicts": scorecard["students"]["slot_conflicts"],
+        "courses_split_across_slots": courses_split_across_slots(slot_assignments),
+        "mean_rooms_per_course": scorecard["courses"]["mean_rooms_per_course"],
+        "building_hops": scorecard["courses"]["building_hops_total"],
+        "violations": check_invariants(slot_assignments, max_courses),
+        "scorecard": scorecard,
+    }
+
+
+def print_report(results: List[Dict[str, object]], baseline: Optional[Dict[str, object]]) -> None:
+    columns = [
+        ("engine", "Engine", 22),
+        ("median_ms", "Median ms", 11),
+        ("seated", "Seated", 8),
+        ("unplaced", "Unplaced", 9),
+        ("rooms_opened", "Rooms", 7),
+        ("seats_wasted", "Wasted", 8),
+        ("slot_conflicts", "Conflicts", 10),
+        ("courses_split_across_slots", "Split/slot", 11),
+        ("mean_rooms_per_course", "Rooms/course", 13),
+        ("building_hops", "Hops", 6),
+    ]
+    print(" ".join(f"{label:<{width}}" for _, label, width in columns) + " Violations")
+    for result in results:
+        print(
+            " ".join(f"{str(result[key]):<{width}}" for key, _, width in columns)
+            + f" {len(result['violations'])}"
+        )
+
+    if baseline is not None:
+        print(f"\nDifferences against {baseline['engine']}:")
+        for result in results:
+            if result is baseline:
+                continue
+            speedup = (
+                baseline["median_ms"] / result["median_ms"] if result["median_ms"] else float("inf")
+            )
+            deltas = ", ".join(
+                f"{key} {result[key] - baseline[key]:+g}"
+                for key in ("seated", "rooms_opened", "slot_conflicts", "courses_split_across_slots")
+            )
+            print(f"  {result['engine']:<22} {speedup:.1f}x speed; {deltas}")
+
+    for result in results:
+        for problem in result["violations"][:10]:
+            print(f"❌ {result['engine']}: {problem}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--enrollments", type=int, default=20000)
+    parser.add_argument("--courses", type=int, default=150)
+    parser.add_argument("--rooms", type=int, default=80)
+    parser.add_argument("--buildings", type=int, default=4)
+    parser.add_argument("--students-csv", type=Path)
+    parser.add_argument("--rooms-csv", type=Path)
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--slots-per-day", type=int, default=2)
+    parser.add_argument("--max-courses", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--algorithms",
+        default="smart,balanced,grouped",
+        help="Comma separated Python algorithms to compare against the browser allocator.",
+    )
+    parser.add_argument("--app", type=Path, default=REPO_DIR / "app.js")
+    parser.add_argument("--json", type=Path, help="Write the full report to this file.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.students_csv or args.rooms_csv:
+        if not (args.students_csv and args.rooms_csv):
+            print("Provide both --students-csv and --rooms-csv, or neither.")
+            return 2
+        rooms = load_rooms_from_csv(args.rooms_csv)
+        students = load_students_from_csv(args.students_csv)
+        source = f"{args.students_csv} + {args.rooms_csv}"
+    else:
+        rooms, students = generate_inputs(
+            args.enrollments, args.courses, args.rooms, args.buildings, args.seed
+        )
+        source = f"synthetic (seed {args.seed})"
+    exam_schedule = build_schedule(args.days, args.slots_per_day)
+    repeat = max(args.repeat, 1)
+    print(
+        f"Inputs: {source}: {len(students)} enrollments, {len(rooms)} rooms, "
+        f"{len(exam_schedule)} slots, max {args.max_courses} course(s) per room\n"
+    )
+
+    results: List[Dict[str, object]] = []
+    baseline: Optional[Dict[str, object]] = None
+    try:
+        timings, slot_assignments, unplaced = run_browser(
+            args.app, rooms, students, exam_schedule, args.max_courses, args.seed, repeat
+        )
+    except RuntimeError as exc:
+        print(f"⚠️  Skipping browser allocator: {exc}")
+    else:
+        baseline = summarize_engine(
+            f"browser ({args.app.name})",
+            timings,
+            slot_assignments,
+            unplaced,
+            exam_schedule,
+            args.max_courses,
+        )
+        results.append(baseline)
+
+    for algorithm in [item.strip() for item in args.algorithms.split(",") if item.strip()]:
+        timings, slot_assignments, unplaced = run_python(
+            rooms, students, exam_schedule, algorithm, args.max_courses, args.seed, repeat
+        )
+        results.append(
+            summarize_engine(
+                f"python ({algorithm})",
+                timings,
+                slot_assignments,
+                unplaced,
+                exam_schedule,
+                args.max_courses,
+            )
+        )
+
+    print_report(results, baseline)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\n✅ Parity report written to {args.json}")
+    return 1 if any(result["violations"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Startup budget check for exam_scheduler.
+
+Runs ``python -X importtime -c "import exam_scheduler"`` several times in fresh
+interpreters and fails when the median cumulative import time exceeds the
+budget, or when a heavy optional dependency (pandas, numpy, openpyxl) is
+pulled in at import time.
+
+    python bench_startup.py [--runs 7] [--budget-ms 40]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+MODULE = "exam_scheduler"
+DEFAULT_BUDGET_MS = 40.0
+FORBIDDEN_AT_IMPORT = ("pandas", "numpy", "openpyxl")
+
+
+def measure_once(repo_dir: Path) -> Tuple[float, Dict[str, int]]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        cwd=repo_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    cumulative: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            total_us = int(parts[1])
+        except ValueError:
+            continue  # header line
+        cumulative[parts[2].strip()] = total_us
+    if MODULE not in cumulative:
+        raise RuntimeError(f"importtime output did not include {MODULE}")
+    return cumulative[MODULE] / 1000.0, cumulative
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    repo_dir = Path(__file__).resolve().parent
+    timings: List[float] = []
+    modules: Dict[str, int] = {}
+    for _ in range(max(args.runs, 1)):
+        elapsed_ms, modules = measure_once(repo_dir)
+        timings.append(elapsed_ms)
+
+    median_ms = statistics.median(timings)
+    print(
+        f"{MODULE} import: median {median_ms:.1f} ms, "
+        f"min {min(timings):.1f} ms, max {max(timings):.1f} ms "
+        f"over {len(timings)} run(s); budget {args.budget_ms:.1f} ms"
+    )
+
+    slowest = sorted(
+        (item for item in modules.items() if item[0] != MODULE),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:5]
+    for name, total_us in slowest:
+        print(f"  {name:<30} {total_us / 1000.0:6.1f} ms")
+
+    failed = False
+    leaked = [
+        name
+        for name in modules
+        if name.split(".")[0] in FORBIDDEN_AT_IMPORT
+    ]
+    if leaked:
+        print(f"❌ Heavy optional modules imported at startup: {', '.join(sorted(leaked))}")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"❌ Startup budget exceeded ({median_ms:.1f} ms > {args.budget_ms:.1f} ms)")
+        failed = True
+    if not failed:
+        print("✅ Startup within budget.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
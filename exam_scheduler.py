@@ -1,15 +1,22 @@
 import csv
 import json
+import mmap
 import random
-from collections import defaultdict, deque
-from dataclasses import dataclass
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict, deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from itertools import chain, groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-try:
-    import pandas as pd  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    pd = None  # type: ignore
+# pandas is only needed for Excel export and is imported lazily by
+# ``_load_pandas``. Check startup cost with ``python bench_startup.py``.
 
 
 # -----------------------------
@@ -37,10 +44,41 @@ class Student:
     site_code: Optional[str] = None
 
 
+@dataclass
+class RoomAggregates:
+    assigned: int
+    capacity: int
+    course_counts: Dict[Tuple[str, str], int]
+    semester_counts: Dict[str, int]
+
+    @property
+    def utilization(self) -> float:
+        if self.capacity <= 0:
+            return 0.0
+        return self.assigned / self.capacity
+
+    @property
+    def courses_label(self) -> str:
+        return ", ".join(
+            sorted(f"{name} ({code})" for code, name in self.course_counts)
+        )
+
+    @property
+    def semesters_label(self) -> str:
+        return ", ".join(sorted(self.semester_counts))
+
+
+_course_of = attrgetter("subject_code", "subject_name")
+_semester_of = attrgetter("semester")
+
+
 @dataclass
 class RoomAssignment:
     room: Room
     students: List[Student]
+    _aggregates: Optional[RoomAggregates] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def utilization(self) -> float:
@@ -48,6 +86,24 @@ class RoomAssignment:
             return 0.0
         return len(self.students) / self.room.capacity
 
+    @property
+    def aggregates(self) -> RoomAggregates:
+        """Per-room course/semester counts, computed once and cached.
+
+        Call ``invalidate_aggregates`` after mutating ``students``.
+        """
+        if self._aggregates is None:
+            self._aggregates = RoomAggregates(
+                assigned=len(self.students),
+                capacity=self.room.capacity,
+                course_counts=dict(Counter(map(_course_of, self.students))),
+                semester_counts=dict(Counter(map(_semester_of, self.students))),
+            )
+        return self._aggregates
+
+    def invalidate_aggregates(self) -> None:
+        self._aggregates = None
+
 
 # -----------------------------
 # CSV Loading Helpers
@@ -314,7 +370,123 @@ def allocate_room(
     return RoomAssignment(room=room, students=assignment)
 
 
-def allocate_rooms_for_slot(
+def _fit_course_in_index(
+    free_index: List[Tuple[int, int]], size: int
+) -> Tuple[List[Tuple[int, int]], int]:
+    """Pick the fewest rooms from ``free_index`` that can seat ``size`` students.
+
+    ``free_index`` is a list of ``(free_seats, room_position)`` sorted
+    ascending. Taking the largest rooms first gives the minimum room count for
+    a course; the last fragment then goes to the smallest room that still fits
+    it (best fit), leaving bigger gaps for other courses. Returns the picked
+    entries and the number of students that could not be covered.
+    """
+    picks: List[Tuple[int, int]] = []
+    remaining = size
+    top = len(free_index) - 1
+    while remaining > 0 and top >= 0:
+        best_fit = bisect_left(free_index, (remaining, -1), 0, top + 1)
+        if best_fit <= top:
+            picks.append(free_index[best_fit])
+            return picks, 0
+        picks.append(free_index[top])
+        remaining -= free_index[top][0]
+        top -= 1
+    return picks, max(remaining, 0)
+
+
+def allocate_rooms_grouped(
+    rooms: Sequence[Room],
+    students_for_slot: Dict[str, List[Student]],
+    max_courses_per_room: int,
+) -> Tuple[List[RoomAssignment], Dict[str, List[Student]]]:
+    """Seat each course in as few rooms as possible, preferably in one building.
+
+    Courses are placed largest first against indexes of free seats, one per
+    building plus one across all rooms. A course stays within a single
+    building only when that needs no more rooms than the best cross-building
+    fit; otherwise it takes the cross-building fit. A room keeps accepting
+    further courses until it is full or holds ``max_courses_per_room``
+    courses, so smaller courses fill the gaps left by larger ones.
+    """
+    limit = max_courses_per_room if max_courses_per_room > 0 else 1
+    free_seats = [max(room.capacity, 0) for room in rooms]
+    course_counts = [0] * len(rooms)
+    seated: List[List[Student]] = [[] for _ in rooms]
+
+    all_index: List[Tuple[int, int]] = []
+    building_index: Dict[Optional[str], List[Tuple[int, int]]] = defaultdict(list)
+    for position, room in enumerate(rooms):
+        if free_seats[position] > 0:
+            all_index.append((free_seats[position], position))
+            building_index[room.building].append((free_seats[position], position))
+    all_index.sort()
+    for free_index in building_index.values():
+        free_index.sort()
+    building_free: Dict[Optional[str], int] = {
+        building: sum(free for free, _ in free_index)
+        for building, free_index in building_index.items()
+    }
+
+    def seat(entry: Tuple[int, int], queue: Deque[Student]) -> None:
+        free, position = entry
+        building = rooms[position].building
+        for free_index in (all_index, building_index[building]):
+            del free_index[bisect_left(free_index, entry)]
+        taken = min(free, len(queue))
+        seated[position].extend(queue.popleft() for _ in range(taken))
+        free_seats[position] -= taken
+        course_counts[position] += 1
+        building_free[building] -= taken
+        if free_seats[position] > 0 and course_counts[position] < limit:
+            refreshed = (free_seats[position], position)
+            insort(all_index, refreshed)
+            insort(building_index[building], refreshed)
+        else:
+            building_free[building] -= free_seats[position]
+
+    residual: Dict[str, List[Student]] = {}
+    ordered = sorted(
+        students_for_slot.items(), key=lambda item: (-len(item[1]), item[0])
+    )
+    for course_key, course_students in ordered:
+        queue: Deque[Student] = deque(course_students)
+        if not queue:
+            continue
+
+        picks, shortfall = _fit_course_in_index(all_index, len(queue))
+        if not shortfall:
+            best: Optional[Tuple[int, int]] = None
+            for building, free_index in building_index.items():
+                if building_free[building] < len(queue):
+                    continue
+                building_picks, building_shortfall = _fit_course_in_index(
+                    free_index, len(queue)
+                )
+                if building_shortfall or len(building_picks) > len(picks):
+                    continue
+                score = (
+                    len(building_picks),
+                    sum(free for free, _ in building_picks) - len(queue),
+                )
+                if best is None or score < best:
+                    best = score
+                    picks = building_picks
+
+        for entry in picks:
+            seat(entry, queue)
+        if queue:
+            residual[course_key] = list(queue)
+
+    assignments = [
+        RoomAssignment(room=room, students=seated[position])
+        for position, room in enumerate(rooms)
+        if seated[position]
+    ]
+    return assignments, residual
+
+
+def _allocate_rooms_sequentially(
     rooms: Sequence[Room],
     students_for_slot: Dict[str, List[Student]],
     algorithm_type: str,
@@ -325,11 +497,6 @@ def allocate_rooms_for_slot(
         key: deque(students) for key, students in students_for_slot.items()
     }
     assignments: List[RoomAssignment] = []
-    total_students = sum(len(queue) for queue in course_pools.values())
-    if total_students == 0:
-        return assignments, {}
-
-    remaining_students_before = total_students
     for room in rooms:
         if sum(len(queue) for queue in course_pools.values()) == 0:
             break
@@ -343,11 +510,51 @@ def allocate_rooms_for_slot(
         if assignment.students:
             assignments.append(assignment)
 
-    residual: Dict[str, List[Student]] = {
-        key: list(queue) for key, queue in course_pools.items() if queue
-    }
+    residual = {key: list(queue) for key, queue in course_pools.items() if queue}
+    return assignments, residual
+
 
-    if residual:
+def allocate_rooms_for_slot(
+    rooms: Sequence[Room],
+    students_for_slot: Dict[str, List[Student]],
+    algorithm_type: str,
+    max_courses_per_room: int,
+    rng: random.Random,
+    verbose: bool = True,
+) -> Tuple[List[RoomAssignment], Dict[str, List[Student]]]:
+    total_students = sum(len(students) for students in students_for_slot.values())
+    if total_students == 0:
+        return [], {}
+
+    remaining_students_before = total_students
+    if algorithm_type == "grouped":
+        assignments, residual = allocate_rooms_grouped(
+            rooms=rooms,
+            students_for_slot=students_for_slot,
+            max_courses_per_room=max_courses_per_room,
+        )
+        if residual:
+            # The slot is over-full: keeping courses together leaves partly
+            # used rooms, so fall back to room-by-room filling if it seats more.
+            fill_assignments, fill_residual = _allocate_rooms_sequentially(
+                rooms=rooms,
+                students_for_slot=students_for_slot,
+                algorithm_type="balanced",
+                max_courses_per_room=max_courses_per_room,
+                rng=rng,
+            )
+            if sum(map(len, fill_residual.values())) < sum(map(len, residual.values())):
+                assignments, residual = fill_assignments, fill_residual
+    else:
+        assignments, residual = _allocate_rooms_sequentially(
+            rooms=rooms,
+            students_for_slot=students_for_slot,
+            algorithm_type=algorithm_type,
+            max_courses_per_room=max_courses_per_room,
+            rng=rng,
+        )
+
+    if residual and verbose:
         assigned_total = remaining_students_before - sum(len(students) for students in residual.values())
         print(
             "⚠️  Warning: Not enough seats for all students in this slot. "
@@ -368,15 +575,16 @@ def prompt_algorithm_choice() -> str:
         "1": ("Smart Randomized Mix", "smart"),
         "2": ("Course-Wise Split", "course-wise"),
         "3": ("Balanced Utilization", "balanced"),
+        "4": ("Keep Courses Together", "grouped"),
     }
     print("\nSelect Algorithm Type:")
     for key, (label, _) in options.items():
         print(f"  {key}. {label}")
     while True:
-        choice = input("Choice [1-3]: ").strip()
+        choice = input("Choice [1-4]: ").strip()
         if choice in options:
             return options[choice][1]
-        print("Invalid selection. Please choose 1, 2, or 3.")
+        print("Invalid selection. Please choose 1, 2, 3, or 4.")
 
 
 def prompt_int(prompt: str, minimum: int = 1, default: Optional[int] = None) -> int:
@@ -438,6 +646,309 @@ def distribute_courses_across_slots(
     return mapping
 
 
+# Penalties used by optimize_slot_assignment, per affected student.
+SLOT_CONFLICT_PENALTY = 1000.0
+SLOT_OVERFLOW_PENALTY = 100.0
+SAME_DAY_PENALTY = 5.0
+SLOT_BALANCE_PENALTY = 1.0
+# Seeded runs bound the search by attempts so the same seed always gives the
+# same plan; this converts the seconds budget. It sits below the slowest rate
+# measured (about 21k/s on 1M enrollments) so the attempt limit is normally
+# reached before the seconds budget, which still applies as a hard stop.
+OPTIMIZE_ITERATIONS_PER_SECOND = 15_000
+
+
+def optimize_slot_assignment(
+    slot_course_map: Dict[int, List[str]],
+    course_groups: Dict[str, List[Student]],
+    exam_schedule: List[Dict[str, str]],
+    slot_capacity: int,
+    rng: random.Random,
+    time_budget: Optional[float] = 2.0,
+    max_iterations: Optional[int] = None,
+) -> Tuple[Dict[int, List[str]], Dict[str, float]]:
+    """Improve a course-to-slot mapping with course moves and swaps.
+
+    The objective penalises, in decreasing order of weight, students with two
+    exams in the same slot, students beyond ``slot_capacity`` in a slot,
+    students with two exams on the same date, and squared deviation of slot
+    headcounts from the mean. Moves are scored incrementally from a
+    precomputed course-overlap table and a per-course/per-slot overlap matrix,
+    and only non-worsening moves are kept. The search stops after
+    ``time_budget`` seconds or ``max_iterations`` attempts, whichever comes
+    first; pass ``time_budget=None`` for a result that depends only on ``rng``.
+    ``stats["deadline_reached"]`` tells whether the clock ended the search.
+    """
+    if time_budget is None and max_iterations is None:
+        raise ValueError("Bound the slot search by time_budget or max_iterations.")
+    # The budget covers building the overlap tables too, which dominates on
+    # very large uploads.
+    deadline = (
+        None if time_budget is None else time.perf_counter() + max(time_budget, 0.0)
+    )
+    num_slots = len(exam_schedule)
+    course_keys = [
+        key for slot_index in range(num_slots) for key in slot_course_map.get(slot_index, [])
+    ]
+    if num_slots < 2 or len(course_keys) < 2:
+        return {index: list(slot_course_map.get(index, [])) for index in range(num_slots)}, {}
+
+    course_index = {key: index for index, key in enumerate(course_keys)}
+    sizes = [len(course_groups.get(key, [])) for key in course_keys]
+    slot_of = [0] * len(course_keys)
+    for slot_index in range(num_slots):
+        for key in slot_course_map.get(slot_index, []):
+            slot_of[course_index[key]] = slot_index
+
+    # Shared-student counts between course pairs.
+    courses_by_student: Dict[str, List[int]] = defaultdict(list)
+    for key, students in course_groups.items():
+        course_id = course_index.get(key)
+        if course_id is None:
+            continue
+        for student in students:
+            courses_by_student[student.roll_number].append(course_id)
+    shared: List[Dict[int, int]] = [defaultdict(int) for _ in course_keys]
+    for taken in courses_by_student.values():
+        for position, first in enumerate(taken):
+            for second in taken[position + 1 :]:
+                if first != second:
+                    shared[first][second] += 1
+                    shared[second][first] += 1
+    del courses_by_student
+
+    day_ids: Dict[str, int] = {}
+    slot_day = [day_ids.setdefault(slot["date"], len(day_ids)) for slot in exam_schedule]
+    day_slots: List[List[int]] = [[] for _ in day_ids]
+    for slot_index, day_id in enumerate(slot_day):
+        day_slots[day_id].append(slot_index)
+
+    # overlap[c][s]: students course c shares with courses currently in slot s.
+    overlap = [[0] * num_slots for _ in course_keys]
+    for course_id, neighbours in enumerate(shared):
+        row = overlap[course_id]
+        for other, count in neighbours.items():
+            row[slot_of[other]] += count
+
+    headcount = [0] * num_slots
+    for course_id, slot_index in enumerate(slot_of):
+        headcount[slot_index] += sizes[course_id]
+    mean_headcount = sum(headcount) / num_slots
+    balance_scale = SLOT_BALANCE_PENALTY / max(slot_capacity, 1)
+
+    def slot_cost(count: int) -> float:
+        return (
+            SLOT_OVERFLOW_PENALTY * max(0, count - slot_capacity)
+            + balance_scale * (count - mean_headcount) ** 2
+        )
+
+    def pair_cost(course_id: int, slot_index: int) -> float:
+        row = overlap[course_id]
+        same_day = sum(row[other] for other in day_slots[slot_day[slot_index]])
+        same_day -= row[slot_index]
+        return SLOT_CONFLICT_PENALTY * row[slot_index] + SAME_DAY_PENALTY * same_day
+
+    def move_delta(course_id: int, target: int) -> float:
+        source = slot_of[course_id]
+        size = sizes[course_id]
+        return (
+            pair_cost(course_id, target)
+            - pair_cost(course_id, source)
+            + slot_cost(headcount[source] - size)
+            + slot_cost(headcount[target] + size)
+            - slot_cost(headcount[source])
+            - slot_cost(headcount[target])
+        )
+
+    def apply_move(course_id: int, target: int) -> None:
+        source = slot_of[course_id]
+        for other, count in shared[course_id].items():
+            overlap[other][source] -= count
+            overlap[other][target] += count
+        headcount[source] -= sizes[course_id]
+        headcount[target] += sizes[course_id]
+        slot_of[course_id] = target
+
+    def total_cost() -> Tuple[float, int, int]:
+        conflicts = same_day = 0
+        for course_id, slot_index in enumerate(slot_of):
+            row = overlap[course_id]
+            conflicts += row[slot_index]
+            same_day += (
+                sum(row[other] for other in day_slots[slot_day[slot_index]])
+                - row[slot_index]
+            )
+        # Every shared student is seen from both courses of the pair.
+        conflicts //= 2
+        same_day //= 2
+        cost = (
+            SLOT_CONFLICT_PENALTY * conflicts
+            + SAME_DAY_PENALTY * same_day
+            + sum(slot_cost(count) for count in headcount)
+        )
+        return cost, conflicts, same_day
+
+    initial_cost, initial_conflicts, initial_same_day = total_cost()
+    slot_members: List[List[int]] = [[] for _ in range(num_slots)]
+    for course_id, slot_index in enumerate(slot_of):
+        slot_members[slot_index].append(course_id)
+
+    iterations = accepted = 0
+    deadline_reached = False
+    while max_iterations is None or iterations < max_iterations:
+        # Checking the clock every iteration is measurable; batch it.
+        if (
+            deadline is not None
+            and iterations % 64 == 0
+            and time.perf_counter() >= deadline
+        ):
+            deadline_reached = True
+            break
+        iterations += 1
+        course_id = rng.randrange(len(course_keys))
+        source = slot_of[course_id]
+        target = rng.randrange(num_slots - 1)
+        if target >= source:
+            target += 1
+
+        if rng.random() < 0.5 or not slot_members[target]:
+            if move_delta(course_id, target) <= 0:
+                apply_move(course_id, target)
+                slot_members[source].remove(course_id)
+                slot_members[target].append(course_id)
+                accepted += 1
+            continue
+
+        partner = rng.choice(slot_members[target])
+        delta = move_delta(course_id, target)
+        apply_move(course_id, target)
+        delta += move_delta(partner, source)
+        if delta <= 0:
+            apply_move(partner, source)
+            slot_members[source].remove(course_id)
+            slot_members[source].append(partner)
+            slot_members[target].remove(partner)
+            slot_members[target].append(course_id)
+            accepted += 1
+        else:
+            apply_move(course_id, source)
+
+    final_cost, final_conflicts, final_same_day = total_cost()
+    mapping = {
+        slot_index: [course_keys[course_id] for course_id in members]
+        for slot_index, members in enumerate(slot_members)
+    }
+    stats = {
+        "iterations": iterations,
+        "accepted_moves": accepted,
+        "deadline_reached": deadline_reached,
+        "initial_cost": round(initial_cost, 2),
+        "final_cost": round(final_cost, 2),
+        "initial_conflicts": initial_conflicts,
+        "final_conflicts": final_conflicts,
+        "initial_same_day": initial_same_day,
+        "final_same_day": final_same_day,
+        "max_slot_headcount": max(headcount),
+        "min_slot_headcount": min(headcount),
+    }
+    return mapping, stats
+
+
+def seeded_rng(seed_input: str) -> random.Random:
+    rng = random.Random()
+    if seed_input:
+        try:
+            rng.seed(int(seed_input))
+        except ValueError:
+            rng.seed(seed_input)
+    return rng
+
+
+def schedule_exams(
+    rooms: Sequence[Room],
+    students: Iterable[Student],
+    exam_schedule: List[Dict[str, str]],
+    algorithm_type: str,
+    max_courses_per_room: int,
+    rng: random.Random,
+    optimize_seconds: float = 0.0,
+    reproducible: bool = False,
+    verbose: bool = True,
+) -> Tuple[Dict[int, List[RoomAssignment]], Dict[str, List[Student]]]:
+    """Run the full pipeline: slot distribution, optional optimization, rooms.
+
+    ``rooms`` should be sorted by capacity (largest first) as returned by
+    ``load_rooms_from_csv``. With ``reproducible`` the slot search is bounded
+    by ``optimize_seconds * OPTIMIZE_ITERATIONS_PER_SECOND`` attempts, so a
+    seeded ``rng`` yields the same plan; ``optimize_seconds`` remains a hard
+    stop, and a warning is printed if it cuts the attempts short.
+    ``verbose=False`` suppresses the progress and warning lines, for callers
+    such as the local server that run several schedules concurrently.
+    Returns the per-slot room assignments and the students that could not be
+    seated, keyed by course.
+    """
+    num_slots = len(exam_schedule)
+    course_groups = group_students_by_course(students)
+    slot_course_map = distribute_courses_across_slots(
+        list(course_groups.keys()), num_slots=num_slots, rng=rng
+    )
+
+    if optimize_seconds > 0:
+        slot_course_map, stats = optimize_slot_assignment(
+            slot_course_map,
+            course_groups,
+            exam_schedule,
+            slot_capacity=sum(room.capacity for room in rooms),
+            rng=rng,
+            time_budget=optimize_seconds,
+            max_iterations=int(optimize_seconds * OPTIMIZE_ITERATIONS_PER_SECOND)
+            if reproducible
+            else None,
+        )
+        if stats and verbose:
+            print(
+                f"Slot optimizer: {stats['accepted_moves']} improving move(s) in "
+                f"{stats['iterations']} attempt(s); conflicts "
+                f"{stats['initial_conflicts']} → {stats['final_conflicts']}, "
+                f"same-day exams {stats['initial_same_day']} → {stats['final_same_day']}, "
+                f"slot headcount {stats['min_slot_headcount']}-{stats['max_slot_headcount']}."
+            )
+        if reproducible and stats.get("deadline_reached") and verbose:
+            print(
+                f"⚠️  Slot optimizer hit the {optimize_seconds:g} s limit before its "
+                f"{int(optimize_seconds * OPTIMIZE_ITERATIONS_PER_SECOND)} attempts; "
+                "this seeded plan may not repeat exactly. Allow more seconds to make it reproducible."
+            )
+
+    slot_assignments: Dict[int, List[RoomAssignment]] = {}
+    spillover_courses: Dict[str, List[Student]] = {}
+
+    for slot_index, slot in enumerate(exam_schedule):
+        assigned_course_keys = slot_course_map.get(slot_index, [])
+        students_for_slot: Dict[str, List[Student]] = {}
+        for key in assigned_course_keys:
+            students_for_slot[key] = course_groups.get(key, []).copy()
+        if verbose:
+            print(
+                f"\nAllocating slot {slot_index + 1}/{num_slots} "
+                f"({slot['date']} - {slot['slot_name']}): "
+                f"{len(assigned_course_keys)} course(s)"
+            )
+        assignments, residual = allocate_rooms_for_slot(
+            rooms=rooms,
+            students_for_slot=students_for_slot,
+            algorithm_type=algorithm_type,
+            max_courses_per_room=max_courses_per_room,
+            rng=rng,
+            verbose=verbose,
+        )
+        slot_assignments[slot_index] = assignments
+        if residual:
+            spillover_courses.update(residual)
+
+    return slot_assignments, spillover_courses
+
+
 def filter_students(
     students: Iterable[Student],
     allowed_semesters: Optional[Sequence[str]] = None,
@@ -458,60 +969,71 @@ def filter_students(
     return filtered
 
 
-def summarize_assignments(
+def iter_summary_rows(
     exam_schedule: List[Dict[str, str]],
-    slot_assignments: Dict[int, List[RoomAssignment]],
-) -> List[Dict[str, object]]:
-    summary: List[Dict[str, object]] = []
+    slot_assignments: Mapping,
+) -> Iterator[Dict[str, object]]:
     for slot_index, slot in enumerate(exam_schedule):
         room_assignments = slot_assignments.get(slot_index, [])
         for assignment in room_assignments:
-            courses = sorted(
-                {
-                    f"{student.subject_name} ({student.subject_code})"
-                    for student in assignment.students
-                }
-            )
-            semesters = sorted({student.semester for student in assignment.students})
-            summary.append(
-                {
-                    "Exam Date": slot["date"],
-                    "Slot": slot["slot_name"],
-                    "Slot Timing": slot["slot_time"],
-                    "Room Name": assignment.room.room_name,
-                    "Room ID": assignment.room.room_id,
-                    "Building": assignment.room.building or "",
-                    "Total Capacity": assignment.room.capacity,
-                    "Students Assigned": len(assignment.students),
-                    "Courses Seated": ", ".join(courses) if courses else "",
-                    "Semesters Seated": ", ".join(semesters) if semesters else "",
-                    "Fully Utilized": "✅ Yes"
-                    if len(assignment.students) >= assignment.room.capacity
-                    else f"❌ No ({len(assignment.students)}/{assignment.room.capacity})",
-                    "Utilization %": round(
-                        100 * assignment.utilization, 2
-                    ),
-                }
-            )
-    return summary
+            aggregates = assignment.aggregates
+            yield {
+                "Exam Date": slot["date"],
+                "Slot": slot["slot_name"],
+                "Slot Timing": slot["slot_time"],
+                "Room Name": assignment.room.room_name,
+                "Room ID": assignment.room.room_id,
+                "Building": assignment.room.building or "",
+                "Total Capacity": aggregates.capacity,
+                "Students Assigned": aggregates.assigned,
+                "Courses Seated": aggregates.courses_label,
+                "Semesters Seated": aggregates.semesters_label,
+                "Fully Utilized": "✅ Yes"
+                if aggregates.assigned >= aggregates.capacity
+                else f"❌ No ({aggregates.assigned}/{aggregates.capacity})",
+                "Utilization %": round(100 * aggregates.utilization, 2),
+            }
 
 
-def export_summary(summary: List[Dict[str, object]], output_dir: Path) -> None:
+def summarize_assignments(
+    exam_schedule: List[Dict[str, str]],
+    slot_assignments: Mapping,
+) -> List[Dict[str, object]]:
+    return list(iter_summary_rows(exam_schedule, slot_assignments))
+
+
+def _load_pandas():
+    try:
+        import pandas as pd  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return pd
+
+
+def export_summary(summary: Iterable[Dict[str, object]], output_dir: Path) -> None:
+    rows = iter(summary)
+    first_row = next(rows, None)
+    if first_row is None:
+        print("No assignments were generated; nothing to export.")
+        return
+
     output_dir.mkdir(parents=True, exist_ok=True)
     csv_path = output_dir / "exam_schedule_summary.csv"
     json_path = output_dir / "exam_schedule_summary.json"
     excel_path = output_dir / "exam_schedule_summary.xlsx"
 
-    if summary:
-        fieldnames = list(summary[0].keys())
-        with csv_path.open("w", newline="", encoding="utf-8") as csv_file:
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(summary)
-        print(f"✅ Summary CSV exported to {csv_path}")
-
-        structured: Dict[str, Dict[str, object]] = {}
-        for row in summary:
+    pd = _load_pandas()
+    # Rows are consumed once: CSV is streamed, JSON is grouped on the fly and
+    # only the Excel export needs the full list in memory.
+    excel_rows: Optional[List[Dict[str, object]]] = [] if pd is not None else None
+    structured: Dict[str, Dict[str, object]] = {}
+    with csv_path.open("w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=list(first_row.keys()))
+        writer.writeheader()
+        for row in chain((first_row,), rows):
+            writer.writerow(row)
+            if excel_rows is not None:
+                excel_rows.append(row)
             slot_key = f"{row['Exam Date']}|{row['Slot']}"
             entry = structured.setdefault(
                 slot_key,
@@ -535,39 +1057,36 @@ def export_summary(summary: List[Dict[str, object]], output_dir: Path) -> None:
                     "utilization_percent": row["Utilization %"],
                 }
             )
-        with json_path.open("w", encoding="utf-8") as json_file:
-            json.dump(list(structured.values()), json_file, indent=2)
-        print(f"✅ Summary JSON exported to {json_path}")
+    print(f"✅ Summary CSV exported to {csv_path}")
 
-        if pd is not None:
-            try:
-                dataframe = pd.DataFrame(summary)
-                dataframe.to_excel(excel_path, index=False)
-                print(f"✅ Summary Excel exported to {excel_path}")
-            except Exception as exc:  # pragma: no cover - optional dependency failure
-                print(
-                    f"⚠️  Unable to export Excel file automatically ({exc}). "
-                    "Install pandas + openpyxl to enable Excel export."
-                )
-        else:
+    with json_path.open("w", encoding="utf-8") as json_file:
+        json.dump(list(structured.values()), json_file, indent=2)
+    print(f"✅ Summary JSON exported to {json_path}")
+
+    if excel_rows is not None:
+        try:
+            dataframe = pd.DataFrame(excel_rows)
+            dataframe.to_excel(excel_path, index=False)
+            print(f"✅ Summary Excel exported to {excel_path}")
+        except Exception as exc:  # pragma: no cover - optional dependency failure
             print(
-                "ℹ️  Install pandas and openpyxl to enable Excel export "
-                f"(skipped writing {excel_path})."
+                f"⚠️  Unable to export Excel file automatically ({exc}). "
+                "Install pandas + openpyxl to enable Excel export."
             )
     else:
-        print("No assignments were generated; nothing to export.")
-
-
-def print_summary_table(summary: List[Dict[str, object]]) -> None:
-    if not summary:
-        print("No room allocations were produced.")
-        return
+        print(
+            "ℹ️  Install pandas and openpyxl to enable Excel export "
+            f"(skipped writing {excel_path})."
+        )
 
-    grouped: Dict[Tuple[str, str], List[Dict[str, object]]] = defaultdict(list)
-    for row in summary:
-        grouped[(row["Exam Date"], row["Slot"])].append(row)
 
-    for (exam_date, slot_name), rows in grouped.items():
+def print_summary_table(summary: Iterable[Dict[str, object]]) -> None:
+    printed_any = False
+    # Rows arrive slot by slot, so consecutive grouping is enough.
+    for (exam_date, slot_name), rows in groupby(
+        summary, key=lambda row: (row["Exam Date"], row["Slot"])
+    ):
+        printed_any = True
         print("\n" + "=" * 80)
         print(f"Exam Date: {exam_date} | Slot: {slot_name}")
         print("=" * 80)
@@ -591,9 +1110,474 @@ def print_summary_table(summary: List[Dict[str, object]]) -> None:
                 f"{row['Semesters Seated']:<20} "
                 f"{row['Fully Utilized']}"
             )
+    if not printed_any:
+        print("No room allocations were produced.")
+        return
     print("\nFinished generating room allocation summary.")
 
 
+# -----------------------------
+# Compact Plan Format
+# -----------------------------
+
+PLAN_MAGIC = b"EXPL"
+PLAN_VERSION = 1
+# magic, version, reserved, slot count, enrollment rows, room count
+_PLAN_HEADER = struct.Struct("<4sHHIII")
+# slot index, rooms used in the slot, seated rows in the slot
+_PLAN_SLOT_HEADER = struct.Struct("<III")
+
+
+@dataclass
+class CompactSlot:
+    """Seating for one slot as room indices plus int32 enrollment row ids.
+
+    ``offsets`` holds one more entry than ``room_indices``; the rows seated in
+    room ``room_indices[i]`` are ``row_ids[offsets[i]:offsets[i + 1]]``.
+    """
+
+    room_indices: Sequence[int]
+    offsets: Sequence[int]
+    row_ids: Sequence[int]
+
+    def rows_for(self, position: int) -> Sequence[int]:
+        return self.row_ids[self.offsets[position] : self.offsets[position + 1]]
+
+
+@dataclass
+class CompactPlan:
+    """Allocation result that references rooms and enrollments by index.
+
+    Row ids point into the enrollment list returned by
+    ``load_students_from_csv`` and room indices into the list returned by
+    ``load_rooms_from_csv``, so a plan can only be unpacked against the same
+    inputs it was packed from.
+    """
+
+    slots: Dict[int, CompactSlot]
+    enrollment_count: int
+    room_count: int
+    _views: List[memoryview] = field(default_factory=list, repr=False, compare=False)
+    _source: Optional[object] = field(default=None, repr=False, compare=False)
+
+    def close(self) -> None:
+        """Release the views held on a decoded buffer and close a mapped file.
+
+        Slices taken from ``slots`` by the caller must be released first.
+        """
+        self.slots = {}
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+    def __enter__(self) -> "CompactPlan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _int32_array(values: Iterable[int]) -> array:
+    packed = array("i", values)
+    if packed.itemsize != 4:  # pragma: no cover - exotic platforms only
+        raise RuntimeError("Compact plans require a 4-byte C int.")
+    return packed
+
+
+def pack_slot_assignments(
+    slot_assignments: Dict[int, List[RoomAssignment]],
+    rooms: Sequence[Room],
+    students: Sequence[Student],
+) -> CompactPlan:
+    room_lookup = {id(room): index for index, room in enumerate(rooms)}
+    row_lookup = {id(student): index for index, student in enumerate(students)}
+
+    slots: Dict[int, CompactSlot] = {}
+    for slot_index, room_assignments in slot_assignments.items():
+        room_indices = _int32_array(())
+        offsets = _int32_array((0,))
+        row_ids = _int32_array(())
+        for assignment in room_assignments:
+            try:
+                room_indices.append(room_lookup[id(assignment.room)])
+                row_ids.extend(row_lookup[id(student)] for student in assignment.students)
+            except KeyError as exc:
+                raise ValueError(
+                    "Assignments reference rooms or students that are not part of "
+                    "the loaded inputs; pack against the original lists."
+                ) from exc
+            offsets.append(len(row_ids))
+        slots[slot_index] = CompactSlot(
+            room_indices=room_indices, offsets=offsets, row_ids=row_ids
+        )
+    return CompactPlan(
+        slots=slots, enrollment_count=len(students), room_count=len(rooms)
+    )
+
+
+def plan_to_bytes(plan: CompactPlan) -> bytes:
+    parts: List[bytes] = [
+        _PLAN_HEADER.pack(
+            PLAN_MAGIC,
+            PLAN_VERSION,
+            0,
+            len(plan.slots),
+            plan.enrollment_count,
+            plan.room_count,
+        )
+    ]
+    for slot_index in sorted(plan.slots):
+        slot = plan.slots[slot_index]
+        parts.append(
+            _PLAN_SLOT_HEADER.pack(slot_index, len(slot.room_indices), len(slot.row_ids))
+        )
+        for values in (slot.room_indices, slot.offsets, slot.row_ids):
+            packed = _int32_array(values)
+            if sys.byteorder == "big":  # pragma: no cover - file format is little-endian
+                packed.byteswap()
+            parts.append(packed.tobytes())
+    return b"".join(parts)
+
+
+def _int32_view(
+    buffer: memoryview, start: int, count: int, views: List[memoryview]
+) -> Sequence[int]:
+    end = start + 4 * count
+    if end > len(buffer):
+        raise ValueError("Compact plan is truncated.")
+    window = buffer[start:end]
+    views.append(window)
+    view = window.cast("i")
+    views.append(view)
+    if sys.byteorder == "big":  # pragma: no cover - file format is little-endian
+        swapped = array("i", view)
+        swapped.byteswap()
+        return swapped
+    return view
+
+
+def _check_slot(
+    slot_index: int, slot: CompactSlot, room_count: int, enrollment_count: int
+) -> None:
+    room_indices, offsets, row_ids = slot.room_indices, slot.offsets, slot.row_ids
+    if len(room_indices) and (min(room_indices) < 0 or max(room_indices) >= room_count):
+        raise ValueError(f"Compact plan slot {slot_index} references an unknown room.")
+    if len(row_ids) and (min(row_ids) < 0 or max(row_ids) >= enrollment_count):
+        raise ValueError(
+            f"Compact plan slot {slot_index} references an unknown enrollment row."
+        )
+    if (
+        offsets[0] != 0
+        or offsets[-1] != len(row_ids)
+        or any(low > high for low, high in zip(offsets, offsets[1:]))
+    ):
+        raise ValueError(f"Compact plan slot {slot_index} has inconsistent offsets.")
+
+
+def plan_from_buffer(buffer) -> CompactPlan:
+    """Decode a plan from any bytes-like object without copying the arrays.
+
+    ``buffer`` may be ``bytes``, an ``mmap`` or ``SharedMemory.buf``; the
+    returned slots hold ``memoryview`` slices of it until ``close`` is called.
+    Every slot is range-checked against the header counts, so a corrupt plan
+    raises ``ValueError`` here rather than seating the wrong students later.
+    """
+    views: List[memoryview] = [memoryview(buffer)]
+    try:
+        view = views[0].cast("B")
+        views.append(view)
+        if len(view) < _PLAN_HEADER.size:
+            raise ValueError("Compact plan is truncated.")
+        magic, version, _, slot_count, enrollment_count, room_count = (
+            _PLAN_HEADER.unpack_from(view, 0)
+        )
+        if magic != PLAN_MAGIC:
+            raise ValueError("Not a compact exam plan (bad magic header).")
+        if version != PLAN_VERSION:
+            raise ValueError(f"Unsupported compact plan version: {version}")
+
+        position = _PLAN_HEADER.size
+        slots: Dict[int, CompactSlot] = {}
+        for _ in range(slot_count):
+            if position + _PLAN_SLOT_HEADER.size > len(view):
+                raise ValueError("Compact plan is truncated.")
+            slot_index, room_total, row_total = _PLAN_SLOT_HEADER.unpack_from(
+                view, position
+            )
+            position += _PLAN_SLOT_HEADER.size
+            room_indices = _int32_view(view, position, room_total, views)
+            position += 4 * room_total
+            offsets = _int32_view(view, position, room_total + 1, views)
+            position += 4 * (room_total + 1)
+            row_ids = _int32_view(view, position, row_total, views)
+            position += 4 * row_total
+            slot = CompactSlot(room_indices=room_indices, offsets=offsets, row_ids=row_ids)
+            _check_slot(slot_index, slot, room_count, enrollment_count)
+            slots[slot_index] = slot
+        if position != len(view):
+            raise ValueError("Compact plan has trailing data.")
+    except ValueError:
+        slots = {}
+        for held in reversed(views):
+            held.release()
+        raise
+    return CompactPlan(
+        slots=slots,
+        enrollment_count=enrollment_count,
+        room_count=room_count,
+        _views=views,
+    )
+
+
+def save_plan(plan: CompactPlan, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(plan_to_bytes(plan))
+
+
+def load_plan(path: Path) -> CompactPlan:
+    """Memory-map a saved plan; call ``close()`` (or use ``with``) when done."""
+    with path.open("rb") as handle:
+        if path.stat().st_size == 0:
+            raise ValueError(f"Compact plan file is empty: {path}")
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        plan = plan_from_buffer(mapped)
+    except ValueError:
+        mapped.close()
+        raise
+    plan._source = mapped
+    return plan
+
+
+class LazySlotAssignments(Mapping):
+    """Read-only ``slot index -> [RoomAssignment]`` view over a compact plan.
+
+    ``Student`` and ``RoomAssignment`` objects are only built for a slot the
+    first time it is accessed.
+    """
+
+    def __init__(
+        self, plan: CompactPlan, rooms: Sequence[Room], students: Sequence[Student]
+    ) -> None:
+        if plan.enrollment_count != len(students) or plan.room_count != len(rooms):
+            raise ValueError(
+                "Compact plan was packed against different inputs "
+                f"({plan.room_count} rooms / {plan.enrollment_count} enrollments, "
+                f"got {len(rooms)} / {len(students)})."
+            )
+        self._plan = plan
+        self._rooms = rooms
+        self._students = students
+        self._cache: Dict[int, List[RoomAssignment]] = {}
+
+    def __getitem__(self, slot_index: int) -> List[RoomAssignment]:
+        cached = self._cache.get(slot_index)
+        if cached is not None:
+            return cached
+        slot = self._plan.slots[slot_index]
+        students = self._students
+        assignments = [
+            RoomAssignment(
+                room=self._rooms[room_index],
+                students=[students[row] for row in slot.rows_for(position)],
+            )
+            for position, room_index in enumerate(slot.room_indices)
+        ]
+        self._cache[slot_index] = assignments
+        return assignments
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._plan.slots)
+
+    def __len__(self) -> int:
+        return len(self._plan.slots)
+
+
+def unpack_slot_assignments(
+    plan: CompactPlan, rooms: Sequence[Room], students: Sequence[Student]
+) -> LazySlotAssignments:
+    return LazySlotAssignments(plan, rooms, students)
+
+
+# -----------------------------
+# Schedule Metrics
+# -----------------------------
+
+_roll_of = attrgetter("roll_number")
+
+
+def compute_schedule_metrics(
+    exam_schedule: List[Dict[str, str]],
+    slot_assignments: Mapping,
+    unplaced_students: int = 0,
+    run: Optional[Dict[str, object]] = None,
+) -> Dict[str, object]:
+    """Score a finished plan in one pass over the slot assignments.
+
+    Courses and buildings are interned to integer ids as rooms are visited;
+    per-day exam counts are tallied with ``Counter.update`` over roll numbers.
+    The result is plain JSON-serialisable data so plans produced with
+    different seeds or strategies can be diffed automatically.
+    """
+    course_ids: Dict[Tuple[str, str], int] = {}
+    course_rooms: List[int] = []
+    course_students: List[int] = []
+    course_buildings: List[set] = []
+    building_ids: Dict[Optional[str], int] = {}
+    day_ids: Dict[str, int] = {}
+    exams_per_day: List[Counter] = []
+
+    slot_rows: List[Dict[str, object]] = []
+    total_rooms = total_offered = total_seated = total_slot_conflicts = 0
+    for slot_index, slot in enumerate(exam_schedule):
+        day_id = day_ids.setdefault(slot["date"], len(day_ids))
+        if day_id == len(exams_per_day):
+            exams_per_day.append(Counter())
+        day_counter = exams_per_day[day_id]
+
+        rooms_opened = seats_offered = seated = 0
+        slot_counter: Counter = Counter()
+        for assignment in slot_assignments.get(slot_index, []):
+            aggregates = assignment.aggregates
+            if not aggregates.assigned:
+                continue
+            rooms_opened += 1
+            seats_offered += aggregates.capacity
+            seated += aggregates.assigned
+            building_id = building_ids.setdefault(
+                assignment.room.building, len(building_ids)
+            )
+            for course, count in aggregates.course_counts.items():
+                course_id = course_ids.get(course)
+                if course_id is None:
+                    course_id = course_ids[course] = len(course_rooms)
+                    course_rooms.append(0)
+                    course_students.append(0)
+                    course_buildings.append(set())
+                course_rooms[course_id] += 1
+                course_students[course_id] += count
+                course_buildings[course_id].add(building_id)
+            slot_counter.update(map(_roll_of, assignment.students))
+
+        day_counter.update(slot_counter)
+        slot_conflicts = sum(1 for exams in slot_counter.values() if exams > 1)
+
+        slot_rows.append(
+            {
+                "exam_date": slot["date"],
+                "slot_name": slot["slot_name"],
+                "rooms_opened": rooms_opened,
+                "seats_offered": seats_offered,
+                "students_seated": seated,
+                "seats_wasted": seats_offered - seated,
+                "utilization_percent": round(100 * seated / seats_offered, 2)
+                if seats_offered
+                else 0.0,
+                "students_with_slot_conflicts": slot_conflicts,
+            }
+        )
+        total_slot_conflicts += slot_conflicts
+        total_rooms += rooms_opened
+        total_offered += seats_offered
+        total_seated += seated
+
+    students_seen: set = set()
+    busiest_day: Counter = Counter()
+    same_day_students: set = set()
+    for day_counter in exams_per_day:
+        students_seen.update(day_counter)
+        for roll, exams in day_counter.items():
+            busiest_day[exams] += 1
+            if exams > 1:
+                same_day_students.add(roll)
+
+    course_labels = [f"{name} ({code})" for code, name in course_ids]
+    hops = [len(buildings) - 1 for buildings in course_buildings]
+    largest_split: Optional[Dict[str, object]] = None
+    if course_rooms:
+        widest = max(
+            range(len(course_rooms)),
+            key=lambda cid: (course_rooms[cid], course_students[cid]),
+        )
+        largest_split = {
+            "course": course_labels[widest],
+            "rooms": course_rooms[widest],
+            "students": course_students[widest],
+        }
+
+    return {
+        "run": dict(run or {}),
+        "totals": {
+            "slots": len(exam_schedule),
+            "rooms_opened": total_rooms,
+            "seats_offered": total_offered,
+            "students_seated": total_seated,
+            "students_unplaced": unplaced_students,
+            "seats_wasted": total_offered - total_seated,
+            "utilization_percent": round(100 * total_seated / total_offered, 2)
+            if total_offered
+            else 0.0,
+        },
+        "slots": slot_rows,
+        "students": {
+            "distinct_students": len(students_seen),
+            "slot_conflicts": total_slot_conflicts,
+            "max_exams_per_day": max(busiest_day) if busiest_day else 0,
+            "students_with_multiple_exams_same_day": len(same_day_students),
+            "exams_per_day_histogram": {
+                str(exams): count for exams, count in sorted(busiest_day.items())
+            },
+        },
+        "courses": {
+            "courses": len(course_rooms),
+            "courses_split_across_rooms": sum(1 for rooms in course_rooms if rooms > 1),
+            "mean_rooms_per_course": round(sum(course_rooms) / len(course_rooms), 2)
+            if course_rooms
+            else 0.0,
+            "largest_split": largest_split,
+            "building_hops_total": sum(hops),
+            "max_building_hops": max(hops) if hops else 0,
+            "courses_spanning_buildings": sum(1 for hop in hops if hop > 0),
+        },
+    }
+
+
+def print_scorecard(scorecard: Dict[str, object]) -> None:
+    totals = scorecard["totals"]
+    students = scorecard["students"]
+    courses = scorecard["courses"]
+    print("\nSchedule scorecard:")
+    print(
+        f"  Rooms opened: {totals['rooms_opened']} | "
+        f"Seats wasted: {totals['seats_wasted']} | "
+        f"Utilization: {totals['utilization_percent']}% | "
+        f"Unplaced: {totals['students_unplaced']}"
+    )
+    print(
+        f"  Max exams per student per day: {students['max_exams_per_day']} "
+        f"({students['students_with_multiple_exams_same_day']} student(s) with more than one; "
+        f"{students['slot_conflicts']} with two exams in the same slot)"
+    )
+    largest = courses["largest_split"]
+    if largest:
+        print(
+            f"  Largest course split: {largest['course']} across {largest['rooms']} room(s) | "
+            f"Building hops: {courses['building_hops_total']}"
+        )
+
+
+def export_scorecard(scorecard: Dict[str, object], output_dir: Path) -> Path:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    scorecard_path = output_dir / "exam_schedule_scorecard.json"
+    with scorecard_path.open("w", encoding="utf-8") as json_file:
+        json.dump(scorecard, json_file, indent=2)
+    print(f"✅ Schedule scorecard exported to {scorecard_path}")
+    return scorecard_path
+
+
 # -----------------------------
 # Main Entry Point
 # -----------------------------
@@ -646,56 +1630,59 @@ def main() -> None:
         return
 
     seed_input = input("Optional random seed (leave blank for system random): ").strip()
-    rng = random.Random()
-    if seed_input:
-        try:
-            rng.seed(int(seed_input))
-        except ValueError:
-            rng.seed(seed_input)
+    rng = seeded_rng(seed_input)
 
-    course_groups = group_students_by_course(filtered_students)
-    slot_course_map = distribute_courses_across_slots(
-        list(course_groups.keys()), num_slots=num_slots, rng=rng
+    optimize_seconds = prompt_int(
+        "Seconds to spend optimizing the slot assignment (0 to skip)",
+        minimum=0,
+        default=2,
     )
 
-    slot_assignments: Dict[int, List[RoomAssignment]] = {}
-    spillover_courses: Dict[str, List[Student]] = {}
-
-    for slot_index, slot in enumerate(exam_schedule):
-        assigned_course_keys = slot_course_map.get(slot_index, [])
-        students_for_slot: Dict[str, List[Student]] = {}
-        for key in assigned_course_keys:
-            students_for_slot[key] = course_groups.get(key, []).copy()
-        print(
-            f"\nAllocating slot {slot_index + 1}/{num_slots} "
-            f"({slot['date']} - {slot['slot_name']}): "
-            f"{len(assigned_course_keys)} course(s)"
-        )
-        assignments, residual = allocate_rooms_for_slot(
-            rooms=rooms,
-            students_for_slot=students_for_slot,
-            algorithm_type=algorithm_type,
-            max_courses_per_room=max_courses_per_room,
-            rng=rng,
-        )
-        slot_assignments[slot_index] = assignments
-        if residual:
-            spillover_courses.update(residual)
+    slot_assignments, spillover_courses = schedule_exams(
+        rooms=rooms,
+        students=filtered_students,
+        exam_schedule=exam_schedule,
+        algorithm_type=algorithm_type,
+        max_courses_per_room=max_courses_per_room,
+        rng=rng,
+        optimize_seconds=optimize_seconds,
+        reproducible=bool(seed_input),
+    )
 
-    if spillover_courses:
-        total_unplaced = sum(len(students) for students in spillover_courses.values())
+    total_unplaced = sum(len(students) for students in spillover_courses.values())
+    if total_unplaced:
         print(
             f"\n⚠️  {total_unplaced} students could not be seated across the configured "
             "slots. Consider adding more slots or rooms."
         )
 
-    summary = summarize_assignments(exam_schedule, slot_assignments)
-    print_summary_table(summary)
+    # Room aggregates are cached on each assignment, so regenerating the rows
+    # for the export below does not recount students.
+    print_summary_table(iter_summary_rows(exam_schedule, slot_assignments))
+
+    scorecard = compute_schedule_metrics(
+        exam_schedule,
+        slot_assignments,
+        unplaced_students=total_unplaced,
+        run={
+            "algorithm": algorithm_type,
+            "max_courses_per_room": max_courses_per_room,
+            "seed": seed_input or None,
+            "enrollments": len(filtered_students),
+        },
+    )
+    print_scorecard(scorecard)
 
     export = input("\nExport summary files? [Y/n]: ").strip().lower()
     if export in ("", "y", "yes"):
         output_dir = Path("output")
-        export_summary(summary, output_dir=output_dir)
+        export_summary(
+            iter_summary_rows(exam_schedule, slot_assignments), output_dir=output_dir
+        )
+        plan_path = output_dir / "exam_schedule_plan.bin"
+        save_plan(pack_slot_assignments(slot_assignments, rooms, students), plan_path)
+        print(f"✅ Compact seating plan exported to {plan_path}")
+        export_scorecard(scorecard, output_dir=output_dir)
     else:
         print("Skipped exporting summary files.")
 
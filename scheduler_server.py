@@ -0,0 +1,287 @@
+"""Local JSON endpoint that lets the browser app hand allocation to Python.
+
+Serves the static app (index.html, app.js, style.css) from this directory
+and exposes:
+
+    GET  /api/health    -> {"status": "ok"}
+    POST /api/allocate  -> run exam_scheduler on a compactly encoded upload
+
+Run with ``python scheduler_server.py [--port 8000]`` and open
+http://127.0.0.1:8000/ in the browser.
+
+Request body (all strings are sent once and referenced by index)::
+
+    {
+      "rooms": [{"id": "EB1-101", "name": "101", "capacity": 41, "building": "EB1"}],
+      "courses": [["AS1108", "Applied Physics"]],
+      "semesters": ["SEMESTER 2"],
+      "students": [["2024BTech013", "Rohit Soni"]],
+      "enrollments": [course, semester, student, course, semester, student, ...],
+      "slots": [{"date": "2025-05-18", "label": "Morning", "start": "09:00", "end": "12:00"}],
+      "algorithm": "smart", "maxCoursesPerRoom": 3, "seed": "42", "optimizeSeconds": 0
+    }
+
+The response mirrors the compact plan format: per slot, room indices into the
+request's ``rooms`` plus enrollment row ids into its ``enrollments`` triples.
+"""
+
+import argparse
+import json
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from exam_scheduler import (
+    Room,
+    Student,
+    compute_schedule_metrics,
+    pack_slot_assignments,
+    schedule_exams,
+    seeded_rng,
+)
+
+ALGORITHMS = ("smart", "course-wise", "balanced", "grouped")
+MAX_BODY_BYTES = 256 * 1024 * 1024
+# Wall-clock limit on the slot search per request, seeded or not.
+MAX_OPTIMIZE_SECONDS = 30.0
+# Only the app itself is served; enrollment CSVs and the rest of the repo are not.
+STATIC_FILES = {
+    "/": "index.html",
+    "/index.html": "index.html",
+    "/app.js": "app.js",
+    "/style.css": "style.css",
+}
+
+
+def _array_field(
+    payload: Dict[str, object], name: str, item: Optional[str] = None
+) -> List[object]:
+    """Return ``payload[name]`` as a list, checking entries are ``item`` shaped.
+
+    ``item`` is ``"object"``, ``"pair"`` or ``None`` (entries not checked).
+    Shape errors raise ``ValueError`` so the client gets a 400, not a reset.
+    """
+    value = payload.get(name)
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ValueError(f"'{name}' must be a JSON array.")
+    if item is None:
+        return value
+    for index, entry in enumerate(value):
+        if item == "object" and not isinstance(entry, dict):
+            raise ValueError(f"'{name}' entry #{index + 1} must be a JSON object.")
+        if item == "pair" and not (isinstance(entry, list) and len(entry) == 2):
+            raise ValueError(f"'{name}' entry #{index + 1} must be a two-item JSON array.")
+    return value
+
+
+def decode_rooms(payload: Dict[str, object]) -> List[Room]:
+    rooms: List[Room] = []
+    for index, raw in enumerate(_array_field(payload, "rooms", "object")):
+        try:
+            capacity = int(raw["capacity"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"Room #{index + 1} has no valid capacity.") from None
+        room_id = str(raw.get("id") or f"ROOM-{index + 1}")
+        rooms.append(
+            Room(
+                room_id=room_id,
+                room_name=str(raw.get("name") or room_id),
+                capacity=max(capacity, 0),
+                building=str(raw.get("building") or "").strip() or None,
+            )
+        )
+    if not rooms:
+        raise ValueError("Request contains no rooms.")
+    return rooms
+
+
+def decode_enrollments(payload: Dict[str, object]) -> List[Student]:
+    courses = _array_field(payload, "courses", "pair")
+    semesters = _array_field(payload, "semesters")
+    people = _array_field(payload, "students", "pair")
+    triples = _array_field(payload, "enrollments")
+    if len(triples) % 3:
+        raise ValueError("'enrollments' must be a flat list of index triples.")
+
+    tables = (courses, semesters, people)
+    students: List[Student] = []
+    try:
+        for position in range(0, len(triples), 3):
+            for offset, table in enumerate(tables):
+                index = triples[position + offset]
+                # Negative indices would silently wrap around to the last entry.
+                if type(index) is not int or not 0 <= index < len(table):
+                    raise IndexError(index)
+            code, name = courses[triples[position]]
+            semester = semesters[triples[position + 1]]
+            roll_number, student_name = people[triples[position + 2]]
+            students.append(
+                Student(
+                    roll_number=str(roll_number),
+                    name=str(student_name or "UNKNOWN"),
+                    subject_code=str(code),
+                    subject_name=str(name or code),
+                    semester=str(semester or "UNKNOWN").upper(),
+                )
+            )
+    except (IndexError, TypeError, ValueError):
+        raise ValueError(
+            f"Enrollment #{position // 3 + 1} references an unknown course, "
+            "semester or student."
+        ) from None
+    if not students:
+        raise ValueError("Request contains no enrollments.")
+    return students
+
+
+def decode_schedule(payload: Dict[str, object]) -> List[Dict[str, str]]:
+    schedule: List[Dict[str, str]] = []
+    for index, raw in enumerate(_array_field(payload, "slots", "object")):
+        label = str(raw.get("label") or f"Slot {index + 1}")
+        # Undated slots are treated as separate days for the same-day metrics.
+        schedule.append(
+            {
+                "date": str(raw.get("date") or raw.get("id") or f"Slot {index + 1}"),
+                "slot_name": label,
+                "slot_time": f"{raw.get('start') or '??'} - {raw.get('end') or '??'}",
+            }
+        )
+    if not schedule:
+        raise ValueError("Request contains no exam slots.")
+    return schedule
+
+
+def allocate_from_payload(payload: Dict[str, object]) -> Dict[str, object]:
+    rooms = decode_rooms(payload)
+    students = decode_enrollments(payload)
+    exam_schedule = decode_schedule(payload)
+
+    algorithm_type = str(payload.get("algorithm") or "smart")
+    if algorithm_type not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm '{algorithm_type}'.")
+    try:
+        max_courses_per_room = max(int(payload.get("maxCoursesPerRoom") or 3), 1)
+        optimize_seconds = float(payload.get("optimizeSeconds") or 0)
+    except (TypeError, ValueError):
+        raise ValueError("maxCoursesPerRoom and optimizeSeconds must be numbers.") from None
+    optimize_seconds = min(max(optimize_seconds, 0.0), MAX_OPTIMIZE_SECONDS)
+    seed_input = str(payload.get("seed") or "").strip()
+
+    started = time.perf_counter()
+    # Progress lines are meant for the CLI; keep them out of the server log.
+    slot_assignments, spillover = schedule_exams(
+        rooms=sorted(rooms, key=lambda room: room.capacity, reverse=True),
+        students=students,
+        exam_schedule=exam_schedule,
+        algorithm_type=algorithm_type,
+        max_courses_per_room=max_courses_per_room,
+        rng=seeded_rng(seed_input),
+        optimize_seconds=optimize_seconds,
+        reproducible=bool(seed_input),
+        verbose=False,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    unplaced = sum(len(group) for group in spillover.values())
+    plan = pack_slot_assignments(slot_assignments, rooms, students)
+    return {
+        "engine": "python",
+        "elapsed_ms": round(elapsed_ms, 2),
+        "unplaced": unplaced,
+        "slots": [
+            {
+                "room_indices": list(plan.slots[index].room_indices),
+                "offsets": list(plan.slots[index].offsets),
+                "row_ids": list(plan.slots[index].row_ids),
+            }
+            for index in range(len(exam_schedule))
+        ],
+        "scorecard": compute_schedule_metrics(
+            exam_schedule,
+            slot_assignments,
+            unplaced_students=unplaced,
+            run={
+                "algorithm": algorithm_type,
+                "max_courses_per_room": max_courses_per_room,
+                "seed": seed_input or None,
+                "enrollments": len(students),
+            },
+        ),
+    }
+
+
+class SchedulerRequestHandler(SimpleHTTPRequestHandler):
+    def send_head(self):
+        # Shared by GET and HEAD, so both are limited to the app files.
+        name = STATIC_FILES.get(self.path.split("?", 1)[0].split("#", 1)[0])
+        if name is None:
+            self.send_error(404, "File not found")
+            return None
+        self.path = f"/{name}"
+        return super().send_head()
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] == "/api/health":
+            self._send_json(200, {"status": "ok", "algorithms": list(ALGORITHMS)})
+            return
+        super().do_GET()
+
+    def do_POST(self) -> None:
+        if self.path.split("?", 1)[0] != "/api/allocate":
+            self._send_json(404, {"error": f"Unknown endpoint {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = 0
+        if length <= 0 or length > MAX_BODY_BYTES:
+            self._send_json(413 if length > 0 else 400, {"error": "Invalid request size."})
+            return
+        try:
+            payload = json.loads(self.rfile.read(length))
+            if not isinstance(payload, dict):
+                raise ValueError("Request body must be a JSON object.")
+            result = allocate_from_payload(payload)
+        except (ValueError, KeyError, AttributeError) as exc:
+            self._send_json(400, {"error": str(exc)})
+            return
+        self._send_json(200, result)
+
+    def _send_json(self, status: int, body: Dict[str, object]) -> None:
+        encoded = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve the exam app with a local Python engine.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    handler = partial(
+        SchedulerRequestHandler, directory=str(Path(__file__).resolve().parent)
+    )
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"🧠 Serving exam app and Python engine on http://{args.host}:{args.port}/")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nServer stopped.")